@@ -2,15 +2,21 @@
 # Built-in Python modules
 # ===============================
 from datetime import date, datetime # To handle dates
-from functools import wraps  # To create custom decorators
+from functools import wraps, lru_cache  # To create custom decorators and memoize helpers
+import hashlib  # To hash emails for Gravatar URLs
+import time  # To time password hashing at startup
+import atexit  # To flush queued writes on shutdown
+import queue  # To hand contact messages to the background writer
+import threading  # To run the background writer
 
 # ===============================
 # Flask core and extensions
 # ===============================
 from flask import Flask, abort, request, render_template, redirect, url_for, flash
+from flask.helpers import get_debug_flag
 from flask_bootstrap import Bootstrap5
+from flask_caching import Cache
 from flask_ckeditor import CKEditor
-from flask_gravatar import Gravatar
 from flask_login import (
     UserMixin,
     login_user,
@@ -20,18 +26,27 @@ from flask_login import (
     current_user
 )
 from flask_sqlalchemy import SQLAlchemy
+import click
+from jinja2 import FileSystemBytecodeCache
 
 # ===============================
 # SQLAlchemy specific
 # ===============================
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload, raiseload
+from sqlalchemy import Integer, String, Text, Index, and_, or_, event, insert, inspect, text
+from sqlalchemy.schema import CreateIndex
 
 # ===============================
 # Security
 # ===============================
 from werkzeug.security import generate_password_hash, check_password_hash
 
+# PBKDF2 runs in C via hashlib.pbkdf2_hmac; the iteration count is pinned so every
+# login/register spends a predictable amount of CPU. The 8-char salt keeps the
+# hash within the 100-char User.password column.
+PASSWORD_HASH_METHOD = 'pbkdf2:sha256:600000'
+PASSWORD_SALT_LENGTH = 8
+
 # ===============================
 # Environment variables
 # ===============================
@@ -53,6 +68,72 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
 ckeditor = CKEditor(app)
 Bootstrap5(app)
+# File-based so that every gunicorn worker sees the same entries and invalidations.
+# Disabled in debug mode so template edits show up straight away.
+cache = Cache(app, config={
+    'CACHE_TYPE': 'NullCache' if get_debug_flag() else 'FileSystemCache',
+    'CACHE_DIR': os.path.join(app.root_path, '.flask_cache'),
+    'CACHE_DEFAULT_TIMEOUT': 300,
+})
+# The cache directory outlives the process; drop pages rendered by a previous deploy
+cache.clear()
+
+# url_for('static') adds a ?v= version to static URLs so they can be cached for a year;
+# unversioned URLs (e.g. hardcoded background images) keep Flask's default revalidation
+STATIC_MAX_AGE = 31_536_000
+
+
+def static_file_mtime(filename):
+    # Last-modified time of a static file
+    return int(os.stat(os.path.join(app.static_folder, filename)).st_mtime)
+
+
+# Static files only change on deploy, so outside debug mode look each one up once per process
+cached_static_file_mtime = lru_cache(maxsize=None)(static_file_mtime)
+
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    if endpoint == 'static' and 'filename' in values:
+        # The reloader doesn't restart on CSS/JS edits, so re-read the mtime while debugging
+        file_mtime = static_file_mtime if app.debug else cached_static_file_mtime
+        try:
+            values['v'] = file_mtime(values['filename'])
+        except OSError:
+            pass
+
+
+@app.after_request
+def add_static_cache_headers(response):
+    # Versioned static URLs never change content, so browsers needn't revalidate them.
+    # Skipped in debug mode so edited assets are always re-fetched during development.
+    if not app.debug and request.endpoint == 'static' and 'v' in request.args and response.status_code in (200, 304):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    return response
+
+
+# Keep compiled templates on disk so fresh worker processes skip re-compiling them
+jinja_cache_dir = os.path.join(app.root_path, '.jinja_cache')
+os.makedirs(jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+
+
+# ===============================
+# Password hashing check
+# ===============================
+# The C-backed hash takes well under a second; far above that means a slow (e.g. pure-Python) backend
+PASSWORD_HASH_WARN_MS = 2000
+
+
+def log_password_hash_time():
+    # Time one hash at startup and warn if the hashing backend is unexpectedly slow
+    start = time.perf_counter()
+    generate_password_hash("startup-benchmark", method=PASSWORD_HASH_METHOD, salt_length=PASSWORD_SALT_LENGTH)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms > PASSWORD_HASH_WARN_MS:
+        app.logger.warning("Password hashing (%s) took %.1f ms, expected under %d ms",
+                           PASSWORD_HASH_METHOD, elapsed_ms, PASSWORD_HASH_WARN_MS)
+
 
 # ===============================
 # Configure Flask-Login
@@ -62,11 +143,20 @@ login_manager.init_app(app)
 
 @login_manager.user_loader
 def load_user(user_id):
-    # Load a user by ID (required by Flask-Login)
-    return db.get_or_404(User, user_id)
+    # Load a user by ID (required by Flask-Login). Flask-Login already calls this at most
+    # once per request, and session.get() checks the identity map before querying.
+    return db.session.get(User, int(user_id))
 
 # For adding profile images to comments
-gravatar = Gravatar(app, size=100, rating='g', default='retro')
+def email_hash(email):
+    # MD5 of the normalised email, as Gravatar expects; stored on User.gravatar_hash
+    return hashlib.md5(email.strip().lower().encode()).hexdigest()
+
+
+def gravatar_url(gravatar_hash, size=100):
+    return f"https://www.gravatar.com/avatar/{gravatar_hash}?s={size}&d=retro&r=g"
+
+app.jinja_env.globals['gravatar_url'] = gravatar_url
 
 
 # ===============================
@@ -76,7 +166,9 @@ class Base(DeclarativeBase):
     pass
 
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
-db = SQLAlchemy(model_class=Base)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'insertmanyvalues_page_size': 1000}
+# Handlers redirect or render straight after committing, so don't expire (and re-SELECT) loaded objects
+db = SQLAlchemy(model_class=Base, session_options={'expire_on_commit': False})
 db.init_app(app)
 
 
@@ -88,11 +180,11 @@ db.init_app(app)
 class BlogPost(db.Model):
     __tablename__ = "blog_posts"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    author_id: Mapped[int] = mapped_column(Integer, db.ForeignKey("users.id"))
+    author_id: Mapped[int] = mapped_column(Integer, db.ForeignKey("users.id"), index=True)
     author = relationship("User", back_populates="posts")
     title: Mapped[str] = mapped_column(String(250), unique=True, nullable=False)
     subtitle: Mapped[str] = mapped_column(String(250), nullable=False)
-    date: Mapped[str] = mapped_column(String(250), nullable=False)
+    date_posted: Mapped[date] = mapped_column(db.Date, nullable=False, default=date.today, index=True)
     body: Mapped[str] = mapped_column(Text, nullable=False)
     img_url: Mapped[str] = mapped_column(String(250), nullable=False)
     project_url: Mapped[str] = mapped_column(String(250), nullable=True)
@@ -106,6 +198,7 @@ class User(UserMixin, db.Model):
     email: Mapped[str] = mapped_column(String(100), unique=True)
     password: Mapped[str] = mapped_column(String(100))
     name: Mapped[str] = mapped_column(String(100))
+    gravatar_hash: Mapped[str] = mapped_column(String(32), nullable=True)  # Precomputed for comment avatars
     posts = relationship("BlogPost", back_populates="author")  # Relationship to user's posts
     comments = relationship("Comment", back_populates="comment_author")  # Relationship to user's comments
 
@@ -115,9 +208,9 @@ class Comment(db.Model):
     __tablename__ = "comments"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     text: Mapped[str] = mapped_column(Text, nullable=False)
-    author_id: Mapped[int] = mapped_column(Integer, db.ForeignKey("users.id"))
+    author_id: Mapped[int] = mapped_column(Integer, db.ForeignKey("users.id"), index=True)
     comment_author = relationship("User", back_populates="comments")
-    post_id: Mapped[str] = mapped_column(Integer, db.ForeignKey("blog_posts.id"))
+    post_id: Mapped[int] = mapped_column(Integer, db.ForeignKey("blog_posts.id"), index=True)
     parent_post = relationship("BlogPost", back_populates="comments")
 
 
@@ -132,8 +225,192 @@ class Message(db.Model):
     date: Mapped[datetime] = mapped_column(db.DateTime, default=datetime.now)
 
 
+# Backs the (date, id) keyset pagination on the admin messages page
+Index("ix_messages_date_id", Message.date.desc(), Message.id.desc())
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run while a write is in progress; NORMAL sync skips fsyncs that WAL
+    # doesn't need, and the memory/mmap settings cut down on read() syscalls
+    cursor = dbapi_connection.cursor()
+    cursor.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA cache_size=-20000;"
+    )
+    cursor.close()
+
+
+def lock_and_get_columns(connection, table_name):
+    # Column names of a table, read after taking a table lock where the database supports
+    # one, so concurrent migration runs can't both decide a column is missing. SQLite has
+    # no table locks; there, migrations rely on init-db running once per deploy.
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE"))
+    return {column["name"] for column in inspect(connection).get_columns(table_name)}
+
+
+def migrate_post_dates():
+    # Older databases stored the post date as formatted text ("October 15, 2026") in
+    # blog_posts.date; move it into the date_posted DATE column and drop the old one
+    with db.engine.begin() as connection:
+        if "date_posted" in lock_and_get_columns(connection, "blog_posts"):
+            return
+        connection.execute(text("ALTER TABLE blog_posts ADD COLUMN date_posted DATE"))
+        for post_id, old_date in connection.execute(text("SELECT id, date FROM blog_posts")).all():
+            connection.execute(
+                text("UPDATE blog_posts SET date_posted = :date_posted WHERE id = :id"),
+                {"date_posted": datetime.strptime(old_date, "%B %d, %Y").date(), "id": post_id},
+            )
+        connection.execute(text("ALTER TABLE blog_posts DROP COLUMN date"))
+        # Match the NOT NULL of a freshly created table. SQLite can't add that constraint to
+        # an existing column, so migrated SQLite databases keep date_posted nullable; the
+        # model's default still fills it on every insert.
+        if connection.dialect.name != "sqlite":
+            connection.execute(text("ALTER TABLE blog_posts ALTER COLUMN date_posted SET NOT NULL"))
+
+
+def migrate_gravatar_hashes():
+    # Older databases have no users.gravatar_hash; add it and fill it in from the emails
+    with db.engine.begin() as connection:
+        if "gravatar_hash" in lock_and_get_columns(connection, "users"):
+            return
+        connection.execute(text("ALTER TABLE users ADD COLUMN gravatar_hash VARCHAR(32)"))
+        for user_id, email in connection.execute(text("SELECT id, email FROM users")).all():
+            connection.execute(
+                text("UPDATE users SET gravatar_hash = :gravatar_hash WHERE id = :id"),
+                {"gravatar_hash": email_hash(email or ""), "id": user_id},
+            )
+
+
 with app.app_context():
+    if db.engine.dialect.name == "sqlite":
+        event.listen(db.engine, "connect", set_sqlite_pragmas)
+
+
+def init_db():
+    # Create and migrate the schema. This runs once per deploy (see init-db below), not on
+    # import, so gunicorn workers starting together don't race each other's DDL.
     db.create_all()  # Create all tables in database
+    migrate_post_dates()
+    migrate_gravatar_hashes()
+    # create_all() skips tables that already exist, so add any missing indexes explicitly.
+    # IF NOT EXISTS lets the database do the existence check atomically.
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+@app.cli.command("init-db")
+def init_db_command():
+    """Create the database tables and apply pending migrations."""
+    init_db()
+    log_password_hash_time()  # Checked once per deploy rather than in every worker
+    click.echo("Database is up to date.")
+
+
+# ===============================
+# Bulk inserts
+# ===============================
+def bulk_add_messages(rows, batch_size=1000):
+    # Insert contact messages (dicts of Message columns) with one executemany per batch
+    # instead of one INSERT and commit per row
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(insert(Message), rows[start:start + batch_size])
+    db.session.commit()
+
+
+# ===============================
+# Background message writer
+# ===============================
+# Contact form submissions are queued and written in batches by a background thread,
+# so the request doesn't wait on the INSERT and commit
+MESSAGE_BATCH_SIZE = 500
+MESSAGE_BATCH_WAIT = 0.1  # Seconds to wait for more messages before writing a batch
+MESSAGE_WRITER_STOP_TIMEOUT = 10  # Seconds to wait at exit for the writer's last batch
+STOP_MESSAGE_WRITER = object()  # Queued at exit to tell the writer to finish up
+message_queue = queue.Queue()
+message_writer_lock = threading.Lock()
+message_writer = None
+
+
+def write_message_batch(batch):
+    with app.app_context():
+        try:
+            bulk_add_messages(batch)
+            return
+        except Exception:
+            db.session.rollback()
+            if len(batch) == 1:
+                app.logger.exception("Failed to save contact message from %r", batch[0].get("email"))
+                return
+            app.logger.warning("Failed to save batch of %d contact messages, retrying one at a time", len(batch))
+    # Retry row by row so one bad message can't discard the rest of the batch
+    for row in batch:
+        write_message_batch([row])
+
+
+def drain_message_queue(block=True):
+    # Collect up to MESSAGE_BATCH_SIZE queued messages. Returns (batch, stop), where stop
+    # is True once the shutdown sentinel has been taken off the queue.
+    try:
+        first = message_queue.get(block=block)
+    except queue.Empty:
+        return [], False
+    if first is STOP_MESSAGE_WRITER:
+        return [], True
+    batch = [first]
+    while len(batch) < MESSAGE_BATCH_SIZE:
+        try:
+            row = message_queue.get(timeout=MESSAGE_BATCH_WAIT)
+        except queue.Empty:
+            break
+        if row is STOP_MESSAGE_WRITER:
+            return batch, True
+        batch.append(row)
+    return batch, False
+
+
+def run_message_writer():
+    while True:
+        batch, stop = drain_message_queue()
+        if batch:
+            write_message_batch(batch)
+        if stop:
+            return
+
+
+def enqueue_message(row):
+    # Start the writer on first use so it runs in the serving process, not a pre-fork parent
+    global message_writer
+    with message_writer_lock:
+        if message_writer is None:
+            message_writer = threading.Thread(target=run_message_writer, name="message-writer", daemon=True)
+            message_writer.start()
+    message_queue.put(row)
+
+
+@atexit.register
+def flush_message_queue():
+    # Let the writer finish the batch it's holding, then save anything still queued.
+    # Only one consumer touches the queue at a time.
+    with message_writer_lock:
+        writer = message_writer
+    if writer is not None and writer.is_alive():
+        message_queue.put(STOP_MESSAGE_WRITER)
+        writer.join(timeout=MESSAGE_WRITER_STOP_TIMEOUT)
+        if writer.is_alive():
+            app.logger.warning("Message writer did not stop in time; %d message(s) may be lost",
+                               message_queue.qsize())
+            return
+    while True:
+        batch, _ = drain_message_queue(block=False)
+        if not batch:
+            break
+        write_message_batch(batch)
 
 
 # ===============================
@@ -142,14 +419,49 @@ with app.app_context():
 def admin_only(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:  # Check if user is logged in
+        user = current_user._get_current_object()  # Resolve the proxy once
+        if not user.is_authenticated:  # Check if user is logged in
             return abort(403)  # Forbidden
-        if current_user.id != 1:
+        if user.id != 1:
             return abort(403)
         return f(*args, **kwargs)
     return decorated_function
 
 
+# ===============================
+# Eager-loading guard
+# ===============================
+def eager_options(*options):
+    # In debug mode, make any relationship not loaded by `options` raise instead of
+    # silently issuing an extra query, so N+1 regressions show up during development
+    if app.debug:
+        return (*options, raiseload('*'))
+    return options
+
+
+# ===============================
+# Rendered page caching
+# ===============================
+ALL_POSTS_CACHE_PREFIX = "all_posts_html"
+VIEWER_ROLES = ("anonymous", "user", "admin")
+
+
+def viewer_role():
+    # The rendered pages differ for logged-out visitors, users and the admin
+    if not current_user.is_authenticated:
+        return "anonymous"
+    return "admin" if current_user.id == 1 else "user"
+
+
+def all_posts_cache_key():
+    return f"{ALL_POSTS_CACHE_PREFIX}/{viewer_role()}"
+
+
+def clear_all_posts_cache():
+    # Call after any commit that adds, changes or removes a post
+    cache.delete_many(*(f"{ALL_POSTS_CACHE_PREFIX}/{role}" for role in VIEWER_ROLES))
+
+
 # ===============================
 # ROUTES
 # ===============================
@@ -160,14 +472,20 @@ def register():
     # Allows new users to sign up
     form = RegisterForm()
     if form.validate_on_submit():
-        result = db.session.execute(db.select(User).where(User.email == form.email.data))
-        user = result.scalar()
+        user = db.session.scalar(db.select(User).where(User.email == form.email.data))
         if user:
             flash("You've already signed up with that email, log in instead!")
             return redirect(url_for('login'))
 
-        hash_and_salted_password = generate_password_hash(form.password.data, method='pbkdf2:sha256', salt_length=8)
-        new_user = User(email=form.email.data, name=form.name.data, password=hash_and_salted_password)
+        hash_and_salted_password = generate_password_hash(
+            form.password.data, method=PASSWORD_HASH_METHOD, salt_length=PASSWORD_SALT_LENGTH
+        )
+        new_user = User(
+            email=form.email.data,
+            name=form.name.data,
+            password=hash_and_salted_password,
+            gravatar_hash=email_hash(form.email.data),
+        )
         db.session.add(new_user)
         db.session.commit()
         login_user(new_user)
@@ -182,8 +500,7 @@ def login():
     form = LoginForm()
     if form.validate_on_submit():
         password = form.password.data
-        result = db.session.execute(db.select(User).where(User.email == form.email.data))
-        user = result.scalar()
+        user = db.session.scalar(db.select(User).where(User.email == form.email.data))
         if not user:
             flash("That email does not exist, please try again.")
             return redirect(url_for('login'))
@@ -206,10 +523,11 @@ def logout():
 
 # Home route
 @app.route('/')
+@cache.cached(timeout=300, key_prefix=all_posts_cache_key)
 def get_all_posts():
     # Display all blog posts
-    result = db.session.execute(db.select(BlogPost))
-    posts = result.scalars().all()
+    # Eager-load authors in a single extra IN query instead of one query per post
+    posts = db.session.scalars(db.select(BlogPost).options(*eager_options(selectinload(BlogPost.author)))).all()
     return render_template("index.html", all_posts=posts, current_user=current_user)
 
 
@@ -222,7 +540,17 @@ def how_it_works():
 @app.route("/post/<int:post_id>", methods=["GET", "POST"])
 def show_post(post_id):
     # Display single blog post and handle comment submission
-    requested_post = db.get_or_404(BlogPost, post_id)
+    # Eager-load comments and their authors so the template doesn't issue 1+N+N queries
+    requested_post = db.session.scalar(
+        db.select(BlogPost)
+        .options(*eager_options(
+            selectinload(BlogPost.comments).selectinload(Comment.comment_author),
+            selectinload(BlogPost.author),
+        ))
+        .where(BlogPost.id == post_id)
+    )
+    if requested_post is None:
+        abort(404)
     comment_form = CommentForm()
     if comment_form.validate_on_submit():
         if not current_user.is_authenticated:
@@ -231,6 +559,8 @@ def show_post(post_id):
         new_comment = Comment(text=comment_form.comment_text.data, comment_author=current_user, parent_post=requested_post)
         db.session.add(new_comment)
         db.session.commit()
+        # Redirect so the post is reloaded with its eager-loading options after the commit
+        return redirect(url_for("show_post", post_id=post_id))
     return render_template("post.html", post=requested_post, current_user=current_user, form=comment_form)
 
 
@@ -247,29 +577,43 @@ def add_new_post():
             body=form.body.data,
             img_url=form.img_url.data,
             project_url=form.project_url.data,
-            author=current_user,
-            date=date.today().strftime("%B %d, %Y")
+            author=current_user
         )
         db.session.add(new_post)
         db.session.commit()
+        clear_all_posts_cache()
         return redirect(url_for("get_all_posts"))
     return render_template("make-post.html", form=form, current_user=current_user)
 
 
 # Edit post route
 @app.route("/edit-post/<int:post_id>", methods=["GET", "POST"])
+@admin_only
 def edit_post(post_id):
     # Admin can edit an existing post
-    post = db.get_or_404(BlogPost, post_id)
-    edit_form = CreatePostForm(title=post.title, subtitle=post.subtitle, img_url=post.img_url, author=post.author, body=post.body)
+    edit_form = CreatePostForm()
     if edit_form.validate_on_submit():
-        post.title = edit_form.title.data
-        post.subtitle = edit_form.subtitle.data
-        post.img_url = edit_form.img_url.data
-        post.author = current_user
-        post.body = edit_form.body.data
+        # Overwrite the post with a single UPDATE, without loading it first
+        result = db.session.execute(
+            db.update(BlogPost)
+            .where(BlogPost.id == post_id)
+            .values(
+                title=edit_form.title.data,
+                subtitle=edit_form.subtitle.data,
+                img_url=edit_form.img_url.data,
+                author_id=current_user.id,
+                body=edit_form.body.data,
+            )
+        )
+        if result.rowcount == 0:
+            abort(404)
         db.session.commit()
-        return redirect(url_for("show_post", post_id=post.id))
+        clear_all_posts_cache()
+        return redirect(url_for("show_post", post_id=post_id))
+    if request.method == "GET":
+        # Only the GET needs the stored post, to pre-fill the form
+        post = db.session.get(BlogPost, post_id) or abort(404)
+        edit_form = CreatePostForm(title=post.title, subtitle=post.subtitle, img_url=post.img_url, author=post.author, body=post.body)
     return render_template("make-post.html", form=edit_form, is_edit=True, current_user=current_user)
 
 
@@ -277,9 +621,10 @@ def edit_post(post_id):
 @app.route("/delete/<int:post_id>")
 @admin_only
 def delete_post(post_id):
-    post_to_delete = db.get_or_404(BlogPost, post_id)
+    post_to_delete = db.session.get(BlogPost, post_id) or abort(404)
     db.session.delete(post_to_delete)
     db.session.commit()
+    clear_all_posts_cache()
     return redirect(url_for('get_all_posts'))
 
 
@@ -295,28 +640,52 @@ def about():
 def contact():
     # Handle contact form submission
     if request.method == "POST":
-        name = request.form.get("name")
-        email = request.form.get("email")
-        phone = request.form.get("phone")
-        message_text = request.form.get("message")
-        new_message = Message(name=name, email=email, phone=phone, message=message_text)
-        db.session.add(new_message)
-        db.session.commit()
+        # Messages are saved in the background, so reject incomplete ones before queueing
+        missing = [field for field in ("name", "email", "message") if not request.form.get(field, "").strip()]
+        if missing:
+            flash(f"Please fill in your {', '.join(missing)}.", "danger")
+            return redirect(url_for("contact"))
+        enqueue_message({
+            "name": request.form.get("name"),
+            "email": request.form.get("email"),
+            "phone": request.form.get("phone"),
+            "message": request.form.get("message"),
+            "date": datetime.now(),
+        })
         flash("✅ Your message has been sent successfully!", "success")
         return redirect(url_for("contact"))
     return render_template("contact.html", current_user=current_user)
 
 
 # Admin messages route
+MESSAGES_PAGE_SIZE = 50
+
+
 @app.route("/admin/messages")
-@admin_only
 @login_required
+@admin_only
 def admin_messages():
-    # Admin can view all contact messages
-    messages = Message.query.order_by(Message.date.desc()).all()
-    return render_template("admin_messages.html", messages=messages, current_user=current_user)
-
-
-# Run the Flask app
+    # Admin can view contact messages, newest first, one page at a time.
+    # Pages are addressed by the (date, id) of the last message on the previous page.
+    before = request.args.get("before", type=datetime.fromisoformat)
+    before_id = request.args.get("before_id", type=int)
+    query = db.select(Message).order_by(Message.date.desc(), Message.id.desc())
+    if before is not None and before_id is not None:
+        query = query.where(or_(Message.date < before, and_(Message.date == before, Message.id < before_id)))
+    # Fetch one extra row to know whether there is a next page
+    messages = db.session.scalars(query.limit(MESSAGES_PAGE_SIZE + 1)).all()
+    next_url = None
+    if len(messages) > MESSAGES_PAGE_SIZE:
+        messages = messages[:MESSAGES_PAGE_SIZE]
+        last = messages[-1]
+        next_url = url_for("admin_messages", before=last.date.isoformat(), before_id=last.id)
+    return render_template("admin_messages.html", messages=messages, next_url=next_url, current_user=current_user)
+
+
+# Run the Flask development server (production uses gunicorn, see wsgi.py and Procfile)
 if __name__ == "__main__":
-    app.run(debug=True, port=5001)
+    with app.app_context():
+        init_db()
+    log_password_hash_time()
+    # Debug mode (template auto-reload, debugger) is opt-in with FLASK_DEBUG=1
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', port=5001)
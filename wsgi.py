@@ -0,0 +1,2 @@
+# WSGI entry point for production servers, e.g. `gunicorn wsgi:app`
+from main import app